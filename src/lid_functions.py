@@ -22,7 +22,121 @@ this program. If not, see <https://www.gnu.org/licenses/>
 """
 
 
-from colorama import Fore
+import mmap
+import os
+import re
+import sys
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import astuple, dataclass
+from functools import cached_property, lru_cache
+from itertools import islice
+
+import numpy as np
+
+
+HEADERS = {"Masses": 0, "Atoms": 1, "Bonds": 2, "Angles": 3, "Dihedrals": 4,
+           "Impropers": 5}
+SECTIONS_SET = frozenset(HEADERS)
+HEADER_RE = re.compile(
+    rb"(?m)^[ \t]*(Masses|Atoms|Bonds|Angles|Dihedrals|Impropers)(?=\s|$)")
+_COUNT_CHUNK = 1 << 20
+
+MOL_PROP = ("atoms", "bonds", "angles", "dihedrals", "impropers")
+MOL_IDX = {name: pos for pos, name in enumerate(MOL_PROP)}
+MOL_SET = frozenset(MOL_PROP)
+TYPES_PROP = ("atom", "bond", "angle", "dihedral", "improper")
+TYPES_IDX = {name: pos for pos, name in enumerate(TYPES_PROP)}
+TYPES_SET = frozenset(TYPES_PROP)
+BOUNDARY_PROP = ("xlo", "xhi", "ylo", "yhi", "zlo", "zhi")
+BOUNDARY_IDX = {name: pos for pos, name in enumerate(BOUNDARY_PROP)}
+BOUNDARY_SET = frozenset(BOUNDARY_PROP)
+
+
+@dataclass(frozen=True)
+class SectionIndex:
+    """Line numbers at which the six sections of LAMMPS input data file
+    start; zero means the corresponding section is absent."""
+
+    masses: int = 0
+    atoms: int = 0
+    bonds: int = 0
+    angles: int = 0
+    dihedrals: int = 0
+    impropers: int = 0
+
+    @cached_property
+    def sorted_lines(self):
+        """Header line numbers of the sections present, in file order."""
+
+        return sorted(line for line in astuple(self) if line > 0)
+
+    @property
+    def last_section_line(self):
+        """Header line number of the last section, or 0 if none exists."""
+
+        return self.sorted_lines[-1] if self.sorted_lines else 0
+
+    def next_section_line(self, line):
+        """Header line number of the first section after line, or None if
+        no section follows it."""
+
+        pos = bisect_right(self.sorted_lines, line)
+        return self.sorted_lines[pos] if pos < len(self.sorted_lines) else None
+
+
+@lru_cache(maxsize=8)
+def _scan_headers_cached(fname, key):
+    """Locate section headers in fname with one compiled-regex pass over an
+    mmap and return {section name: (byte offset, line number)} for the
+    headers present; key carries (mtime, size) so the cache entry is
+    invalidated whenever the file changes on disk."""
+
+    # An empty file has no sections, and mmap refuses zero-length maps.
+    if key[1] == 0:
+        return {}
+
+    offsets = {}
+
+    with open(fname, "rb") as ifile, \
+            mmap.mmap(ifile.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+
+        for match in HEADER_RE.finditer(mm):
+            offsets.setdefault(match.group(1).decode(), match.start(1))
+
+        headers = {}
+        pos = line_no = 0
+
+        for name, offset in sorted(offsets.items(), key=lambda kv: kv[1]):
+
+            # Count newlines in bounded chunks; slicing the whole gap at
+            # once would transiently copy most of the file when a large
+            # section sits between two headers.
+            while pos < offset:
+                end = min(offset, pos + _COUNT_CHUNK)
+                line_no += mm[pos:end].count(b"\n")
+                pos = end
+
+            headers[name] = (offset, line_no)
+
+    return headers
+
+
+def _scan_headers(fname):
+    """Return the memoized section header offsets and line numbers of
+    fname, rescanning only when the file changes on disk."""
+
+    key = (os.path.getmtime(fname), os.path.getsize(fname))
+    return _scan_headers_cached(fname, key)
+
+
+def _section_index(fname):
+    """Return the SectionIndex of fname built from the memoized header
+    scan."""
+
+    headers = _scan_headers(fname)
+    return SectionIndex(**{name.lower(): headers[name][1]
+                           for name in headers})
 
 
 def lid_header(fname):
@@ -49,33 +163,49 @@ def lid_header(fname):
 
     """
 
-    with open(fname, "r") as ifile:
-        lines = ifile.readlines()
-        ifile.close()
-
-    sections = ["Masses", "Atoms", "Bonds", "Angles", "Dihedrals", "Impropers"]
-    molecular_prop = ["atoms", "bonds", "angles", "dihedrals", "impropers"]
-    types_prop = ["atom", "bond", "angle", "dihedral", "improper"]
-    boundary_prop = ["xlo", "xhi", "ylo", "yhi", "zlo", "zhi"]
     molecular_data = [0, 0, 0, 0, 0]
     types_data = [0, 0, 0, 0, 0]
     boundary_data = [0, 0, 0, 0, 0, 0]
 
-    for line in lines:
-        line = line.split()
+    def handle_molecular(line):
+
+        if line[1] in MOL_SET:
+            molecular_data[MOL_IDX[line[1]]] = line[0]
+
+    def handle_types(line):
+
+        if line[1] in TYPES_SET:
+            types_data[TYPES_IDX[line[1]]] = line[0]
+
+    def handle_boundary(line):
+
+        if line[2] in BOUNDARY_SET:
+            boundary_data[BOUNDARY_IDX[line[2]]] = line[0]
+            boundary_data[BOUNDARY_IDX[line[2]] + 1] = line[1]
 
-        if (len(line) >= 2 and line[1] in molecular_prop):
-            molecular_data[molecular_prop.index(line[1])] = line[0]
+    handlers = {2: handle_molecular, 3: handle_types, 4: handle_boundary}
 
-        elif (len(line) >= 3 and line[1] in types_prop):
-            types_data[types_prop.index(line[1])] = line[0]
+    with open(fname, "r") as ifile:
+
+        for line in ifile:
+
+            if line[0] in "#\n":
+                continue
+
+            # Strip any trailing comment so lines like "10 atoms # total"
+            # keep their bare token count for the length dispatch below.
+            line = line.split("#", 1)[0].split()
+
+            if not line:
+                continue
 
-        elif (len(line) >= 4 and line[2] in boundary_prop):
-            boundary_data[boundary_prop.index(line[2])] = line[0]
-            boundary_data[boundary_prop.index(line[2]) + 1] = line[1]
+            if line[0] in SECTIONS_SET:
+                break
 
-        elif ((len(line) >= 1) and (line[0] in sections)):
-            break
+            handler = handlers.get(len(line))
+
+            if handler is not None:
+                handler(line)
 
     return molecular_data, types_data, boundary_data
 
@@ -107,106 +237,145 @@ def parse_lid(fname):
 
     """
 
-    with open(fname, "r") as ifile:
-        lines = ifile.readlines()
-        ifile.close()
+    return [[line, 0] for line in astuple(_section_index(fname))]
 
-    mas_section = [0, 0]
-    atm_section = [0, 0]
-    bnd_section = [0, 0]
-    ang_section = [0, 0]
-    dih_section = [0, 0]
-    imp_section = [0, 0]
 
-    counter = 0
+def _section_bounds(in_data, idx):
+    """Return the (start, stop) line slice bounds of section idx in parse_lid
+    output. start is None when the section is absent and stop is None when
+    the section is the last one in the file."""
 
-    for line in lines:
-        line = line.split()
+    index = SectionIndex(*(section[0] for section in in_data))
+    start = in_data[idx][0]
 
-        if (len(line) >= 1 and line[0] == "Masses"):
-            mas_section[0] = counter
+    if start == 0:
+        return None, None
 
-        elif (len(line) >= 1 and line[0] == "Atoms"):
-            atm_section[0] = counter
+    return start + 1, index.next_section_line(start)
 
-        elif (len(line) >= 1 and line[0] == "Bonds"):
-            bnd_section[0] = counter
 
-        elif (len(line) >= 1 and line[0] == "Angles"):
-            ang_section[0] = counter
+@lru_cache(maxsize=8)
+def _parse_all_cached(fname, key):
+    """Tokenize fname in a single pass; key carries (mtime, size) so the
+    cache entry is invalidated whenever the file changes on disk."""
 
-        elif (len(line) >= 1 and line[0] == "Dihedrals"):
-            dih_section[0] = counter
+    sections = {}
+    current = None
 
-        elif (len(line) >= 1 and line[0] == "Impropers"):
-            imp_section[0] = counter
+    with open(fname, "r") as ifile:
 
-        counter += 1
+        for line in ifile:
 
-    return [mas_section, atm_section, bnd_section, ang_section, dih_section,
-            imp_section]
+            # Comment and blank lines are common in real data files; skip
+            # them on the first character before paying for a split.
+            if line[0] in "#\n":
+                continue
 
+            line = line.split()
 
-def masses(fname):
-    """This function returns masses section from LAMMPS input data file.
+            if line:
+
+                if line[0] in HEADERS:
+                    current = sections[line[0]] = []
+
+                elif current is not None:
+                    current.append(line)
+
+    return sections
+
+
+def parse_all(fname):
+    """This function tokenizes all sections of LAMMPS input data file in a
+    single pass over the file.
 
     Syntax:
-        masses_data = masses(fname)
+        lid_data = parse_all(fname)
 
     Input argument(s):
         fname: Name of LAMMPS input data file.
 
     Output argument(s):
-        masses_data: Data of atomic masses of elements in the relevant force
-        field in LAMMPS input data file.
+        The output argument of this function is a dictionary mapping section
+        names ("Masses", "Atoms", "Bonds", "Angles", "Dihedrals", and
+        "Impropers") to lists of tokenized data rows. Sections which do not
+        exist in LAMMPS input data file are absent from the dictionary.
 
     Example:
-        masses_data = masses("system.data")
+        lid_data = parse_all("system.data")
 
     """
 
-    in_data = parse_lid(fname)
+    key = (os.path.getmtime(fname), os.path.getsize(fname))
+    return _parse_all_cached(fname, key)
+
+
+_SECTION_WARNINGS = {
+    "Masses": ("Warning: No masses data available.",
+               "LAMMPS simulation can't run."),
+    "Atoms": ("Warning: No atoms data available.",
+              "LAMMPS simulation can't run."),
+    "Bonds": ("Warning: No bonds data available.",
+              "LAMMPS simulation may produce wrong results."),
+    "Angles": ("Warning: No angles data available.",
+               "LAMMPS simulation may produce wrong results."),
+    "Dihedrals": ("Warning: No dihedrals data available.",
+                  "LAMMPS simulation may produce wrong results."),
+    "Impropers": ("Warning: No impropers data available.",
+                  "LAMMPS simulation may produce wrong results."),
+}
+
+
+def _warn(message):
+    """Write a warning message to stderr, in red when stderr is a terminal;
+    colorama is imported lazily so that purely programmatic users do not pay
+    its ANSI setup at module import."""
+
+    prefix = ""
+
+    if sys.stderr.isatty():
+        from colorama import Fore
+        prefix = Fore.RED
+
+    sys.stderr.write(prefix + message + "\n")
+
 
-    stop = []
+def _section(fname, name):
+    """Return the tokenized rows of section name from the one-pass parse,
+    warning when the section is absent."""
 
-    if in_data[0][0] == 0:
-        print(Fore.RED + "Warning: No masses data available.")
-        print(Fore.RED + "LAMMPS simulation can't run.")
-        masses_data = None
-        start = -1
-        stop = -1
+    data = parse_all(fname).get(name)
 
-    elif in_data[0][0] == max(in_data)[0]:
-        start = in_data[0][0] + 1
-        stop = None
-    else:
-        for element in enumerate(in_data):
+    if data is None:
 
-            if element[1][0] - in_data[0][0] == 0:
-                stop.append(5000000000000)
+        for message in _SECTION_WARNINGS[name]:
+            _warn(message)
 
-            elif element[1][0] - in_data[0][0] < 0:
-                stop.append(5000000000000)
+        return None
 
-            elif element[1][0] - in_data[0][0] > 0:
-                stop.append(element[1][0] - in_data[0][0])
+    # Copy the rows as well as the outer list so callers mutating their
+    # result (including in-place token conversion) cannot corrupt the cache.
+    return [row[:] for row in data]
 
-        stop = stop.index(min(stop))
-        stop = in_data[stop][0]
-        start = in_data[0][0] + 1
 
-    with open(fname, "r") as infile:
-        lines = infile.readlines()[start:stop]
-        infile.close()
+def masses(fname):
+    """This function returns masses section from LAMMPS input data file.
+
+    Syntax:
+        masses_data = masses(fname)
+
+    Input argument(s):
+        fname: Name of LAMMPS input data file.
+
+    Output argument(s):
+        masses_data: Data of atomic masses of elements in the relevant force
+        field in LAMMPS input data file.
 
-    masses_data = []
-    for line in lines:
-        line = line.split()
+    Example:
+        masses_data = masses("system.data")
 
-        if line != []:
-            masses_data.append(line)
+    """
 
-    return masses_data
+    return _section(fname, "Masses")
 
 
 def atoms(fname):
@@ -228,298 +397,583 @@ def atoms(fname):
 
     """
 
-    in_data = parse_lid(fname)
+    return _section(fname, "Atoms")
 
-    stop = []
 
-    if in_data[1][0] == 0:
-        print(Fore.RED + "Warning: No atoms data available.")
-        print(Fore.RED + "LAMMPS simulation can't run.")
-        atoms_data = None
-        start = -1
-        stop = -1
+def bonds(fname):
+    """This function returns bonds section from LAMMPS input data file.
 
-    elif in_data[1][0] == max(in_data)[0]:
-        start = in_data[1][0] + 1
-        stop = None
+    Syntax:
+        bonds_data = bonds(fname)
 
-    else:
-        for element in enumerate(in_data):
+    Input argument(s):
+        fname: Name of LAMMPS input data file.
 
-            if element[1][0] - in_data[1][0] == 0:
-                stop.append(5000000000000)
+    Output argument(s):
+        bonds_data: Bonds data (bond IDs, bond types, atomic IDs of bonding
+        atoms) from LAMMPS input data file.
 
-            elif element[1][0] - in_data[1][0] < 0:
-                stop.append(5000000000000)
+    Example:
+        bonds_data = bonds("system.data")
 
-            elif element[1][0] - in_data[1][0] > 0:
-                stop.append(element[1][0] - in_data[1][0])
+    """
 
-        stop = stop.index(min(stop))
-        stop = in_data[stop][0]
-        start = in_data[1][0] + 1
+    return _section(fname, "Bonds")
 
-    with open(fname, "r") as infile:
-        lines = infile.readlines()[start:stop]
-        infile.close()
 
-    atoms_data = []
-    for line in lines:
-        line = line.split()
+def angles(fname):
+    """This function returns angles section from LAMMPS input data file.
+
+    Syntax:
+        angles_data = angles(fname)
+
+    Input argument(s):
+        fname: Name of LAMMPS input data file.
+
+    Output argument(s):
+        angles_data: Angles data (angle IDs, angle types, and atomic IDs having
+        angle) from LAMMPS input data file.
 
-        if line != []:
-            atoms_data.append(line)
+    Example:
+        angles_data = angles("system.data")
 
-    return atoms_data
+    """
 
+    return _section(fname, "Angles")
 
-def bonds(fname):
-    """This function returns bonds section from LAMMPS input data file.
+
+def dihedrals(fname):
+    """This function returns dihedrals section from LAMMPS input data file.
 
     Syntax:
-        bonds_data = bonds(fname)
+        dihedrals_data = dihedrals(fname)
 
     Input argument(s):
         fname: Name of LAMMPS input data file.
 
     Output argument(s):
-        bonds_data: Bonds data (bond IDs, bond types, atomic IDs of bonding
-        atoms) from LAMMPS input data file.
+        dihedrals_data: Dihedrals data (dihedral IDs, dihedral types, and
+        atomic IDs having dihedral angle) from LAMMPS input data file.
 
     Example:
-        bonds_data = bonds("system.data")
+        dihedrals_data = dihedrals("system.data")
 
     """
 
-    in_data = parse_lid(fname)
+    return _section(fname, "Dihedrals")
 
-    stop = []
 
-    if in_data[2][0] == 0:
-        print(Fore.RED + "Warning: No atoms data available.")
-        print(Fore.RED + "LAMMPS simulation may produce wrong results.")
-        bonds_data = None
-        start = -1
-        stop = -1
+def impropers(fname):
+    """This function returns impropers section from LAMMPS input data file.
 
-    elif in_data[2][0] == max(in_data)[0]:
-        start = in_data[2][0] + 1
-        stop = None
+    Syntax:
+        impropers_data = impropers(fname)
 
-    else:
-        for element in enumerate(in_data):
+    Input argument(s):
+        fname: Name of LAMMPS input data file.
 
-            if element[1][0] - in_data[2][0] == 0:
-                stop.append(5000000000000)
+    Output argument(s):
+        impropers_data: Impropers data (improper IDs, improper types, and
+        atomic IDs having improper angle) from LAMMPS input data file.
 
-            elif element[1][0] - in_data[2][0] < 0:
-                stop.append(5000000000000)
+    Example:
+        impropers_data = impropers("system.data")
 
-            elif element[1][0] - in_data[2][0] > 0:
-                stop.append(element[1][0] - in_data[2][0])
+    """
 
-        stop = stop.index(min(stop))
-        stop = in_data[stop][0]
-        start = in_data[2][0] + 1
+    return _section(fname, "Impropers")
 
-    with open(fname, "r") as infile:
-        lines = infile.readlines()[start:stop]
-        infile.close()
 
-    bonds_data = []
-    for line in lines:
-        line = line.split()
+def _section_bytes(fname, name):
+    """Return the raw bytes of section name in fname, read directly from
+    the byte range recorded by the header scan, or None if the section is
+    absent."""
 
-        if line != []:
-            bonds_data.append(line)
+    headers = _scan_headers(fname)
 
-    return bonds_data
+    if name not in headers:
+        return None
 
+    offset = headers[name][0]
+    stop = min((info[0] for info in headers.values() if info[0] > offset),
+               default=None)
+
+    with open(fname, "rb") as ifile:
+        ifile.seek(offset)
+        ifile.readline()
+
+        if stop is None:
+            return ifile.read()
+
+        return ifile.read(stop - ifile.tell())
 
-def angles(fname):
-    """This function returns angles section from LAMMPS input data file.
+
+def atoms_fast(fname, float64=False):
+    """This function returns atoms section from LAMMPS input data file as a
+    numpy array using a C-level tokenizer over the raw section bytes.
 
     Syntax:
-        angles_data = angles(fname)
+        atoms_data = atoms_fast(fname)
 
     Input argument(s):
         fname: Name of LAMMPS input data file.
 
     Output argument(s):
-        angles_data: Angles data (angle IDs, angle types, and atomic IDs having
-        angle) from LAMMPS input data file.
+        atoms_data: Two dimensional numpy array of all columns of the atoms
+        section, or None if the section is absent from LAMMPS input data
+        file. Unlike atoms(), no Python-level per-line loop is involved, so
+        large sections parse considerably faster.
 
     Example:
-        angles_data = angles("system.data")
+        atoms_data = atoms_fast("system.data")
 
     """
 
+    dtype = np.float64 if float64 else np.float32
+    buf = _section_bytes(fname, "Atoms")
+
+    if buf is None:
+        return None
+
+    if b"#" in buf:
+        buf = b"\n".join(line.split(b"#", 1)[0]
+                         for line in buf.splitlines())
+
+    raw_rows = buf.split(b"\n")
+    first = next((row for row in raw_rows if row.strip()), b"")
+    ncols = len(first.split())
+
+    if ncols == 0:
+        return np.empty((0, 0))
+
+    # Only build the array when every row has the same width; a ragged
+    # section whose token total happens to be a multiple of ncols would
+    # otherwise reshape into misaligned garbage with no error.
+    row_tokens = [row.split() for row in raw_rows if row.strip()]
+
+    if all(len(row) == ncols for row in row_tokens):
+
+        try:
+            return np.array(row_tokens, dtype=dtype)
+
+        except ValueError:
+            pass
+
+    # Ragged rows are valid LAMMPS (image flags are optional per line)
+    # and loadtxt rejects them too, so normalize the tokenized rows to
+    # the width of the first one instead: missing trailing columns
+    # default to zero and extra ones are dropped.
+    rows = []
+
+    for row in atoms(fname):
+
+        if "#" in row:
+            row = row[:row.index("#")]
+
+        rows.append(row[:ncols] + ["0"] * (ncols - len(row)))
+
+    return np.array(rows, dtype=dtype)
+
+
+def _section_width(fname, idx):
+    """Number of data columns in the first row of section idx of fname, or
+    0 if the section is absent or holds no rows."""
+
     in_data = parse_lid(fname)
+    start, stop = _section_bounds(in_data, idx)
 
-    stop = []
+    if start is None:
+        return 0
 
-    if in_data[3][0] == 0:
-        print(Fore.RED + "Warning: No angles data available.")
-        print(Fore.RED + "LAMMPS simulation may produce wrong results.")
-        angles_data = None
-        start = -1
-        stop = -1
+    with open(fname, "r") as ifile:
 
-    elif in_data[3][0] == max(in_data)[0]:
-        start = in_data[3][0] + 1
-        stop = None
+        for line in islice(ifile, start, stop):
+            row = line.split("#", 1)[0].split()
 
-    else:
-        for element in enumerate(in_data):
+            if row:
+                return len(row)
 
-            if element[1][0] - in_data[3][0] == 0:
-                stop.append(5000000000000)
+    return 0
 
-            elif element[1][0] - in_data[3][0] < 0:
-                stop.append(5000000000000)
 
-            elif element[1][0] - in_data[3][0] > 0:
-                stop.append(element[1][0] - in_data[3][0])
+def _section_array(fname, idx, dtype, usecols=None):
+    """Load section idx of fname into a 2-D numpy array of the given dtype
+    with numpy's C tokenizer, or return None if the section is absent."""
 
-        stop = stop.index(min(stop))
-        stop = in_data[stop][0]
-        start = in_data[3][0] + 1
+    in_data = parse_lid(fname)
+    start, stop = _section_bounds(in_data, idx)
 
-    with open(fname, "r") as infile:
-        lines = infile.readlines()[start:stop]
-        infile.close()
+    if start is None:
+        return None
 
-    angles_data = []
-    for line in lines:
-        line = line.split()
+    with open(fname, "r") as ifile:
+        return np.loadtxt(islice(ifile, start, stop), dtype=dtype,
+                          usecols=usecols, ndmin=2)
 
-        if line != []:
-            angles_data.append(line)
 
-    return angles_data
+def masses_array(fname, float64=False):
+    """This function returns masses section from LAMMPS input data file as a
+    numpy array.
 
+    Syntax:
+        masses_data = masses_array(fname)
 
-def dihedrals(fname):
-    """This function returns dihedrals section from LAMMPS input data file.
+    Input argument(s):
+        fname: Name of LAMMPS input data file.
+
+        float64: Load values in double precision instead of the default
+        single precision. Atomic masses rarely need more than FP32 for
+        post-analysis work.
+
+    Output argument(s):
+        masses_data: Two dimensional numpy array of atom types and atomic
+        masses, or None if the section is absent from LAMMPS input data file.
+
+    Example:
+        masses_data = masses_array("system.data")
+
+    """
+
+    return _section_array(fname, 0,
+                          np.float64 if float64 else np.float32)
+
+
+def atoms_array(fname, float64=False):
+    """This function returns atoms section from LAMMPS input data file as a
+    numpy array.
 
     Syntax:
-        dihedrals_data = dihedrals(fname)
+        atoms_data = atoms_array(fname)
 
     Input argument(s):
         fname: Name of LAMMPS input data file.
 
+        float64: Load values in double precision instead of the default
+        single precision. Coordinates and charges rarely need more than
+        FP32 for post-analysis topology work, and single precision halves
+        the memory footprint.
+
     Output argument(s):
-        dihedrals_data: Dihedrals data (dihedral IDs, dihedral types, and
-        atomic IDs having dihedral angle) from LAMMPS input data file.
+        atoms_data: Two dimensional numpy array of atomic IDs, molecular IDs,
+        atom types, charges, and x, y, z coordinates (the first seven columns
+        of the atoms section), or None if the section is absent from LAMMPS
+        input data file.
 
     Example:
-        dihedrals_data = dihedrals("system.data")
+        atoms_data = atoms_array("system.data")
 
     """
 
-    in_data = parse_lid(fname)
+    # atom_style molecular/bond/angle sections have fewer than the seven
+    # columns of the full style, so clamp the selection to what is there.
+    width = _section_width(fname, 1)
+
+    return _section_array(fname, 1,
+                          np.float64 if float64 else np.float32,
+                          usecols=range(min(7, width)) if width else None)
 
-    stop = []
 
-    if in_data[4][0] == 0:
-        print(Fore.RED + "Warning: No dihedrals data available.")
-        print(Fore.RED + "LAMMPS simulation may produce wrong results.")
-        dihedrals_data = None
-        start = -1
-        stop = -1
+def atoms_soa(fname):
+    """This function returns atoms section from LAMMPS input data file as a
+    structure-of-arrays dictionary of typed numpy columns.
 
-    elif in_data[4][0] == max(in_data)[0]:
-        start = in_data[4][0] + 1
-        stop = None
+    Syntax:
+        atoms_data = atoms_soa(fname)
 
-    else:
-        for element in enumerate(in_data):
+    Input argument(s):
+        fname: Name of LAMMPS input data file.
+
+    Output argument(s):
+        atoms_data: Dictionary of contiguous per-column numpy arrays with
+        keys "id" (int64 atomic IDs), "mol" (int64 molecular IDs), "type"
+        (int32 atom types), "q" (float32 charges), and "xyz" (float32 array
+        of shape N x 3 with x, y, z coordinates), or None if the section is
+        absent from LAMMPS input data file. Columnar storage keeps each
+        quantity contiguous in memory for vectorized analysis and avoids
+        per-element Python objects.
+
+        This column layout is that of the seven-column full atom style;
+        sections of any other width raise ValueError rather than mislabel
+        the physical quantities.
 
-            if element[1][0] - in_data[4][0] == 0:
-                stop.append(5000000000000)
+    Example:
+        atoms_data = atoms_soa("system.data")
 
-            elif element[1][0] - in_data[4][0] < 0:
-                stop.append(5000000000000)
+    """
 
-            elif element[1][0] - in_data[4][0] > 0:
-                stop.append(element[1][0] - in_data[4][0])
+    arr = atoms_array(fname, float64=True)
 
-        stop = stop.index(min(stop))
-        stop = in_data[stop][0]
-        start = in_data[4][0] + 1
+    if arr is None:
+        return None
 
-    with open(fname, "r") as infile:
-        lines = infile.readlines()[start:stop]
-        infile.close()
+    if arr.shape[1] != 7:
+        raise ValueError("atoms_soa() requires the seven-column full atom "
+                         "style; %s has %d columns" % (fname, arr.shape[1]))
 
-    dihedrals_data = []
-    for line in lines:
-        line = line.split()
+    return dict(id=arr[:, 0].astype(np.int64),
+                mol=arr[:, 1].astype(np.int64),
+                type=arr[:, 2].astype(np.int32),
+                q=arr[:, 3].astype(np.float32),
+                xyz=np.ascontiguousarray(arr[:, 4:7], dtype=np.float32))
 
-        if line != []:
-            dihedrals_data.append(line)
 
-    return dihedrals_data
+def bonds_array(fname):
+    """This function returns bonds section from LAMMPS input data file as a
+    numpy array.
 
+    Syntax:
+        bonds_data = bonds_array(fname)
 
-def impropers(fname):
-    """This function returns impropers section from LAMMPS input data file.
+    Input argument(s):
+        fname: Name of LAMMPS input data file.
+
+    Output argument(s):
+        bonds_data: Two dimensional int32 numpy array of bond IDs, bond
+        types, and atomic IDs of bonding atoms, or None if the section is
+        absent from LAMMPS input data file.
+
+    Example:
+        bonds_data = bonds_array("system.data")
+
+    """
+
+    return _section_array(fname, 2, np.int32)
+
+
+def angles_array(fname):
+    """This function returns angles section from LAMMPS input data file as a
+    numpy array.
 
     Syntax:
-        impropers_data = impropers(fname)
+        angles_data = angles_array(fname)
 
     Input argument(s):
         fname: Name of LAMMPS input data file.
 
     Output argument(s):
-        impropers_data: Impropers data (improper IDs, improper types, and
-        atomic IDs having improper angle) from LAMMPS input data file.
+        angles_data: Two dimensional int32 numpy array of angle IDs, angle
+        types, and atomic IDs having angle, or None if the section is absent
+        from LAMMPS input data file.
 
     Example:
-        impropers_data = impropers("system.data")
+        angles_data = angles_array("system.data")
 
     """
 
-    in_data = parse_lid(fname)
+    return _section_array(fname, 3, np.int32)
+
+
+def dihedrals_array(fname):
+    """This function returns dihedrals section from LAMMPS input data file as
+    a numpy array.
+
+    Syntax:
+        dihedrals_data = dihedrals_array(fname)
+
+    Input argument(s):
+        fname: Name of LAMMPS input data file.
+
+    Output argument(s):
+        dihedrals_data: Two dimensional int32 numpy array of dihedral IDs,
+        dihedral types, and atomic IDs having dihedral angle, or None if the
+        section is absent from LAMMPS input data file.
+
+    Example:
+        dihedrals_data = dihedrals_array("system.data")
+
+    """
+
+    return _section_array(fname, 4, np.int32)
+
+
+def impropers_array(fname):
+    """This function returns impropers section from LAMMPS input data file as
+    a numpy array.
+
+    Syntax:
+        impropers_data = impropers_array(fname)
+
+    Input argument(s):
+        fname: Name of LAMMPS input data file.
+
+    Output argument(s):
+        impropers_data: Two dimensional int32 numpy array of improper IDs,
+        improper types, and atomic IDs having improper angle, or None if the
+        section is absent from LAMMPS input data file.
+
+    Example:
+        impropers_data = impropers_array("system.data")
+
+    """
+
+    return _section_array(fname, 5, np.int32)
+
+
+def parse_arrays(fname):
+    """This function loads all six sections of LAMMPS input data file into
+    numpy arrays, parsing the sections in parallel.
+
+    Syntax:
+        lid_arrays = parse_arrays(fname)
+
+    Input argument(s):
+        fname: Name of LAMMPS input data file.
+
+    Output argument(s):
+        lid_arrays: Dictionary mapping the section names ("Masses", "Atoms",
+        "Bonds", "Angles", "Dihedrals", and "Impropers") to the numpy arrays
+        returned by the corresponding *_array function, or to None for
+        sections absent from LAMMPS input data file. Sections are
+        independent once the header scan has located them, so each one is
+        tokenized on its own worker thread; numpy's tokenizer releases the
+        GIL, letting the parses overlap.
+
+    Example:
+        lid_arrays = parse_arrays("system.data")
+
+    """
+
+    loaders = {"Masses": masses_array, "Atoms": atoms_array,
+               "Bonds": bonds_array, "Angles": angles_array,
+               "Dihedrals": dihedrals_array, "Impropers": impropers_array}
+
+    # Prime the shared header cache once so the workers do not race to
+    # scan the same file.
+    _scan_headers(fname)
+
+    with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+        futures = {name: executor.submit(loader, fname)
+                   for name, loader in loaders.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+class LidFile:
+    """This class provides random-access reads of LAMMPS input data file.
+
+    Constructing a LidFile scans the file's section headers once; every
+    subsequent read seeks straight to the cached byte offsets, so repeated
+    access to sections of the same unchanged file costs no further full
+    scans. The stateless module-level functions remain available and share
+    the same memoized scans, so either style of access may be mixed freely.
+
+    Syntax:
+        lid = LidFile(fname)
+
+    Input argument(s):
+        fname: Name of LAMMPS input data file.
+
+    Example:
+        lid = LidFile("system.data")
+        mol_data, typ_data, bnd_data = lid.header()
+        atoms_data = lid.atoms()
+        atoms_xyz = lid.atoms_soa()["xyz"]
+
+    """
+
+    def __init__(self, fname):
+        self._fname = os.fspath(fname)
+        self._headers = _scan_headers(self._fname)
+
+    @property
+    def fname(self):
+        """Name of LAMMPS input data file."""
+
+        return self._fname
+
+    @property
+    def index(self):
+        """SectionIndex with the header line numbers of the sections."""
+
+        return _section_index(self._fname)
+
+    def header(self):
+        """Return (molecular_data, types_data, boundary_data) as produced
+        by lid_header()."""
+
+        return lid_header(self._fname)
+
+    def section(self, name):
+        """Return the tokenized rows of the named section ("Masses",
+        "Atoms", "Bonds", "Angles", "Dihedrals", or "Impropers"), warning
+        and returning None when it is absent."""
+
+        return _section(self._fname, name)
+
+    def masses(self):
+        """Return masses section as tokenized rows, like masses()."""
+
+        return self.section("Masses")
+
+    def atoms(self):
+        """Return atoms section as tokenized rows, like atoms()."""
+
+        return self.section("Atoms")
+
+    def bonds(self):
+        """Return bonds section as tokenized rows, like bonds()."""
+
+        return self.section("Bonds")
+
+    def angles(self):
+        """Return angles section as tokenized rows, like angles()."""
+
+        return self.section("Angles")
+
+    def dihedrals(self):
+        """Return dihedrals section as tokenized rows, like dihedrals()."""
+
+        return self.section("Dihedrals")
+
+    def impropers(self):
+        """Return impropers section as tokenized rows, like impropers()."""
+
+        return self.section("Impropers")
+
+    def masses_array(self, float64=False):
+        """Return masses section as a numpy array, like masses_array()."""
+
+        return masses_array(self._fname, float64=float64)
+
+    def atoms_array(self, float64=False):
+        """Return atoms section as a numpy array, like atoms_array()."""
+
+        return atoms_array(self._fname, float64=float64)
+
+    def atoms_fast(self, float64=False):
+        """Return atoms section via the byte-buffer tokenizer, like
+        atoms_fast()."""
+
+        return atoms_fast(self._fname, float64=float64)
 
-    stop = []
+    def atoms_soa(self):
+        """Return atoms section as typed columns, like atoms_soa()."""
 
-    if in_data[5][0] == 0:
-        print(Fore.RED + "Warning: No impropers data available.")
-        print(Fore.RED + "LAMMPS simulation may produce wrong results.")
-        impropers_data = None
-        start = -1
-        stop = -1
+        return atoms_soa(self._fname)
 
-    elif in_data[5][0] == max(in_data)[0]:
-        start = in_data[5][0] + 1
-        stop = None
+    def bonds_array(self):
+        """Return bonds section as a numpy array, like bonds_array()."""
 
-    else:
-        for element in enumerate(in_data):
+        return bonds_array(self._fname)
 
-            if element[1][0] - in_data[5][0] == 0:
-                stop.append(5000000000000)
+    def angles_array(self):
+        """Return angles section as a numpy array, like angles_array()."""
 
-            elif element[1][0] - in_data[5][0] < 0:
-                stop.append(5000000000000)
+        return angles_array(self._fname)
 
-            elif element[1][0] - in_data[5][0] > 0:
-                stop.append(element[1][0] - in_data[5][0])
+    def dihedrals_array(self):
+        """Return dihedrals section as a numpy array, like
+        dihedrals_array()."""
 
-        stop = stop.index(min(stop))
-        stop = in_data[stop][0]
-        start = in_data[5][0] + 1
+        return dihedrals_array(self._fname)
 
-    with open(fname, "r") as infile:
-        lines = infile.readlines()[start:stop]
-        infile.close()
+    def impropers_array(self):
+        """Return impropers section as a numpy array, like
+        impropers_array()."""
 
-    impropers_data = []
-    for line in lines:
-        line = line.split()
+        return impropers_array(self._fname)
 
-        if line != []:
-            impropers_data.append(line)
+    def arrays(self):
+        """Return all sections as numpy arrays in parallel, like
+        parse_arrays()."""
 
-    return impropers_data
+        return parse_arrays(self._fname)